@@ -19,13 +19,14 @@ from dash._grouping import (
 )
 from dash._utils import (
     stringify_id,
-    to_json,
 )
 from dash.dependencies import (
     Output,
 )
 from dash.exceptions import PreventUpdate
 
+from django_plotly_dash._patches import to_json_django_plotly
+
 
 def register_callback(
     callback_list, callback_map, config_prevent_initial_callbacks, *_args, **_kwargs
@@ -113,7 +114,8 @@ def register_callback(
             response = {"response": component_ids, "multi": True}
 
             try:
-                jsonResponse = to_json(response)
+                # the response body is sent as is, so skip decoding it
+                jsonResponse = to_json_django_plotly(response, as_bytes=True)
             except TypeError:
                 _validate.fail_callback_output(output_value, output)
 
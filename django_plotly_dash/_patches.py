@@ -66,7 +66,23 @@ def promise_clean_to_json_compatible(obj):
     return obj
 
 
-def to_json_django_plotly(plotly_object, pretty=False, engine=None):
+def _orjson_default(obj):
+    """Convert the objects orjson cannot serialise natively, short of a full clean.
+
+    Nested Dash components and plotly objects are handled through ``to_plotly_json``, and Django
+    lazy strings are forced; anything else raises ``TypeError`` so that the caller falls back to
+    cleaning the whole object.
+    """
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    try:
+        return obj.to_plotly_json()
+    except AttributeError:
+        pass
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_json_django_plotly(plotly_object, pretty=False, engine=None, as_bytes=False):
     """
     Convert a plotly/Dash object to a JSON string representation
 
@@ -87,9 +103,13 @@ def to_json_django_plotly(plotly_object, pretty=False, engine=None):
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
 
+    as_bytes: bool (default False)
+        True if the UTF-8 encoded representation should be returned, which
+        avoids decoding the output of the "orjson" engine.
+
     Returns
     -------
-    str
+    str or bytes
         Representation of input object as a JSON string
 
     See Also
@@ -127,7 +147,8 @@ def to_json_django_plotly(plotly_object, pretty=False, engine=None):
             # Remove all whitespace
             opts["separators"] = (",", ":")
 
-        return json.dumps(plotly_object, cls=DjangoPlotlyJSONEncoder, **opts)
+        encoded = json.dumps(plotly_object, cls=DjangoPlotlyJSONEncoder, **opts)
+        return encoded.encode("utf-8") if as_bytes else encoded
     elif engine == "orjson":
         config.validate_orjson()
         opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
@@ -144,7 +165,8 @@ def to_json_django_plotly(plotly_object, pretty=False, engine=None):
 
         # Try without cleaning
         try:
-            return orjson.dumps(plotly_object, option=opts).decode("utf8")
+            encoded = orjson.dumps(plotly_object, default=_orjson_default, option=opts)
+            return encoded if as_bytes else encoded.decode("utf8")
         except TypeError:
             pass
 
@@ -157,7 +179,8 @@ def to_json_django_plotly(plotly_object, pretty=False, engine=None):
 
         cleaned = promise_clean_to_json_compatible(cleaned)
 
-        return orjson.dumps(cleaned, option=opts).decode("utf8")
+        encoded = orjson.dumps(cleaned, option=opts)
+        return encoded if as_bytes else encoded.decode("utf8")
 
 
 import plotly.io.json
@@ -1,20 +1,86 @@
 from __future__ import annotations
 
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Callable
 
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
 from django_plotly_dash.utils import stateless_app_lookup_hook
 
 if TYPE_CHECKING:
     from django_plotly_dash.django_dash import DjangoDash
 
+#: The number of unknown app names remembered, to avoid repeating stateless lookups.
+MISSING_APPS_CACHE_SIZE: int = 128
+
 
 class AppRegistry:
-    """A registry for stateless apps."""
+    """A registry for stateless apps.
+
+    Names that neither the registry nor the ``stateless_loader`` can resolve are remembered, and
+    the loader is not asked about them again. A miss is thus assumed to be permanent, until the
+    app is registered, the ``PLOTLY_DASH`` setting changes or :meth:`forget_missing` is called.
+    """
 
-    _stateless_app_lookup_func: Callable | None = None
+    __slots__ = ("_apps", "_apps_view", "_lock", "_missing")
 
     def __init__(self):
-        self.apps: dict[str, DjangoDash] = {}
+        self._apps: dict[str, DjangoDash] = {}
+        self._apps_view = MappingProxyType(self._apps)
+        self._lock = threading.RLock()
+        self._missing: OrderedDict[str, None] = OrderedDict()
+
+    @property
+    def apps(self) -> MappingProxyType:
+        """Get a read-only view of the registered apps.
+
+        Use :meth:`register` to add an app; attempting to mutate the view raises ``TypeError``.
+
+        Returns
+        -------
+        MappingProxyType
+            A live, read-only mapping of app names to apps.
+        """
+        return self._apps_view
+
+    def register(self, name: str, app: DjangoDash) -> None:
+        """Register a stateless app under a name.
+
+        Writes are serialised through a lock; reads in :meth:`get` rely on single dict
+        operations being atomic. The name is interned so that lookups with interned strings
+        (such as identifiers from Python source) match on identity.
+
+        Parameters
+        ----------
+        name : str
+            The name of the app.
+        app : DjangoDash
+            The app to register.
+        """
+        name = sys.intern(name)
+        with self._lock:
+            self._apps[name] = app
+            self._missing.pop(name, None)
+
+    def forget_missing(self, name: str | None = None) -> None:
+        """Clear the record of app names that could not be found.
+
+        Call this when a ``stateless_loader`` may now resolve an app it could not find before.
+
+        Parameters
+        ----------
+        name : str | None
+            The app name to forget, or None to forget all of them.
+        """
+        with self._lock:
+            if name is None:
+                self._missing.clear()
+            else:
+                self._missing.pop(name, None)
 
     def get(self, name: str) -> DjangoDash:
         """Get a stateless app by name.
@@ -34,14 +100,43 @@ class AppRegistry:
         KeyError
             If the app is not found.
         """
-        app = self.apps.get(name)
+        try:
+            return self._apps[name]
+        except KeyError:
+            pass
+        app = self.try_get(name)
         if app is None:
-            app = self.lookup_stateless_app(name)
-        if not app:
-            # TODO wrap this in raising a 404 if not found
             raise KeyError(f"Unable to find stateless DjangoApp called {name}!")
         return app
 
+    def try_get(self, name: str) -> DjangoDash | None:
+        """Get a stateless app by name, without raising if it is not found.
+
+        Parameters
+        ----------
+        name : str
+            The name of the app to retrieve.
+
+        Returns
+        -------
+        DjangoDash | None
+            The stateless app, or None if it is not found.
+        """
+        try:
+            return self._apps[name]
+        except KeyError:
+            pass
+        if name in self._missing:
+            return None
+        app = self.lookup_stateless_app(name)
+        if app:
+            return app
+        with self._lock:
+            self._missing[name] = None
+            if len(self._missing) > MISSING_APPS_CACHE_SIZE:
+                self._missing.popitem(last=False)
+        return None
+
     @property
     def lookup_stateless_app(self) -> Callable:
         """Get the stateless app lookup function.
@@ -51,9 +146,14 @@ class AppRegistry:
         Callable
             The stateless app lookup function.
         """
-        if self._stateless_app_lookup_func is None:
-            self._stateless_app_lookup_func = stateless_app_lookup_hook()
-        return self._stateless_app_lookup_func
+        return stateless_app_lookup_hook()
 
 
 registry = AppRegistry()
+
+
+@receiver(setting_changed)
+def _reset_missing_apps(setting, **kwargs):
+    "Forget unknown app names when the PLOTLY_DASH setting, and so the stateless loader, changes"
+    if setting == "PLOTLY_DASH":
+        registry.forget_missing()
@@ -26,25 +26,298 @@ SOFTWARE.
 """
 from __future__ import annotations
 
+import functools
+import hashlib
+import inspect
 import json
-from contextlib import suppress
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
 import dash
 from dash import Dash
-from dash._utils import inputs_to_dict, split_callback_id
+from dash._utils import AttributeDict, split_callback_id
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.text import slugify
-from flask import Flask
+from flask import Flask, url_for
 
 from django_plotly_dash._patches import DjangoPlotlyJSONEncoder
 from django_plotly_dash.middleware import EmbeddedHolder
 from django_plotly_dash.pseudo_flask import PseudoFlask
 from django_plotly_dash.utils import wid2str
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_encoder = DjangoPlotlyJSONEncoder()
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _loads(data: bytes | str) -> Any:
+        """Decode JSON using orjson."""
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        """Encode JSON using orjson, deferring unsupported types to the Django Plotly encoder."""
+        return orjson.dumps(obj, default=_json_encoder.default, option=_ORJSON_OPTIONS)
+
+    def _dumps_key(obj: Any) -> bytes:
+        """Encode JSON with sorted keys, for use as a cache key."""
+        return orjson.dumps(
+            obj,
+            default=_json_encoder.default,
+            option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS,
+        )
+
+else:
+
+    def _loads(data: bytes | str) -> Any:
+        """Decode JSON using the standard library."""
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        """Encode JSON compactly using the Django Plotly encoder."""
+        return json.dumps(
+            obj, cls=DjangoPlotlyJSONEncoder, separators=(",", ":")
+        ).encode("utf-8")
+
+    def _dumps_key(obj: Any) -> str:
+        """Encode JSON with sorted keys, for use as a cache key."""
+        return json.dumps(
+            obj, cls=DjangoPlotlyJSONEncoder, separators=(",", ":"), sort_keys=True
+        )
+
+
+#: The number of augmented initial layouts to keep, keyed on a digest of the base layout and
+#: the overrides. Each entry holds a full encoded layout, so the memory used per process grows
+#: with this size and the size of the layouts; see :func:`clear_layout_caches`.
+INITIAL_LAYOUT_CACHE_SIZE: int = 32
+
+#: The keys of a layout node that hold nested components.
+_NESTED_KEYS: tuple[str, ...] = ("children", "props")
+
+#: The keys of a layout node that are not extracted as component values.
+_NON_VALUE_KEYS: frozenset[str] = frozenset(("props", "options", "children", "id"))
+
+#: The placeholder markup into which the Dash renderer mounts the app.
+_APP_ENTRY: str = """
+<div id="react-entry-point">
+  <div class="_dash-loading">
+    Loading...
+  </div>
+</div>
+"""
+
+
+class _BoundedCache:
+    """A small thread-safe mapping that drops its least recently used entries."""
+
+    __slots__ = ("_data", "_lock", "maxsize")
+
+    def __init__(self, maxsize: int):
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+
+    def get(self, key) -> Any:
+        """Return the value stored under a key, or None if there is none."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value) -> None:
+        """Store a value under a key, dropping the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all the entries."""
+        with self._lock:
+            self._data.clear()
+
+
+#: The augmented initial layouts, keyed on (base layout digest, encoded overrides).
+_augmented_layouts = _BoundedCache(INITIAL_LAYOUT_CACHE_SIZE)
+
+#: The component id indexes of base layouts, keyed on the same digest as the layouts above.
+_layout_id_indexes = _BoundedCache(INITIAL_LAYOUT_CACHE_SIZE)
+
+
+def _layout_digest(base_layout: bytes) -> bytes:
+    """Return a short digest identifying an encoded layout, to use in place of it as a key."""
+    return hashlib.blake2b(base_layout, digest_size=16).digest()
+
+
+def _augmented_layout(base_layout: bytes, overrides_key: bytes | str) -> bytes:
+    """Apply encoded overrides to an encoded base layout, returning the encoded result.
+
+    The result only depends on the base layout and the overrides, so it is memoized; only a
+    digest of the base layout is kept in the key.
+    """
+    digest = _layout_digest(base_layout)
+    key = digest, overrides_key
+    augmented = _augmented_layouts.get(key)
+    if augmented is None:
+        augmented = _dumps(
+            _replace_by_path(
+                _loads(base_layout),
+                _layout_id_paths(base_layout, digest),
+                _loads(overrides_key),
+            )
+        )
+        _augmented_layouts.put(key, augmented)
+    return augmented
+
+
+def clear_layout_caches() -> None:
+    """Drop the memoized initial layouts, for example to release their memory."""
+    _augmented_layouts.clear()
+    _layout_id_indexes.clear()
+
+
+@receiver(setting_changed)
+def _reset_layout_caches(setting, **kwargs):
+    "Drop the memoized initial layouts when the PLOTLY_DASH setting is overridden"
+    if setting == "PLOTLY_DASH":
+        clear_layout_caches()
+
+
+def _layout_id_paths(
+    base_layout: bytes, digest: bytes | None = None
+) -> dict[str, tuple[tuple, ...]]:
+    """Index an encoded layout by component id, mapping each id to the paths of its nodes.
+
+    A path is the sequence of keys and list indices leading from the root of the decoded layout
+    to a node holding that id. The index is memoized on the digest of the layout, which is
+    computed if not given.
+    """
+    if digest is None:
+        digest = _layout_digest(base_layout)
+    id_paths = _layout_id_indexes.get(digest)
+    if id_paths is None:
+        id_paths = _index_layout_ids(base_layout)
+        _layout_id_indexes.put(digest, id_paths)
+    return id_paths
+
+
+def _index_layout_ids(base_layout: bytes) -> dict[str, tuple[tuple, ...]]:
+    """Build the component id index of an encoded layout, see :func:`_layout_id_paths`."""
+    paths = {}
+    stack = [((), _loads(base_layout))]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            thisID = node.get("id", None)
+            if isinstance(thisID, dict):
+                thisID = wid2str(thisID)
+            if thisID is not None:
+                paths.setdefault(thisID, []).append(path)
+            children = node.items()
+        elif isinstance(node, list):
+            children = enumerate(node)
+        else:
+            continue
+        for k, v in children:
+            if isinstance(v, (dict, list)):
+                stack.append(((*path, k), v))
+    return {thisID: tuple(id_paths) for thisID, id_paths in paths.items()}
+
+
+def _replace_by_path(
+    data: dict, id_paths: dict[str, tuple[tuple, ...]], overrides: dict
+) -> dict:
+    """Apply overrides, in place, to the nodes of a decoded layout found through its id index.
+
+    This gives the same result as :func:`_walk_tree_and_replace`, visiting only the overridden
+    nodes: as in the walk, a node inside a value that has already been replaced is left alone.
+    """
+    targets = [
+        (path, replacements)
+        for thisID, replacements in overrides.items()
+        for path in id_paths.get(thisID, ())
+    ]
+    # ancestors first, so that the nodes beneath a replaced value can be skipped
+    targets.sort(key=lambda target: len(target[0]))
+    replaced = set()
+    for path, replacements in targets:
+        if any(path[:i] in replaced for i in range(1, len(path) + 1)):
+            continue
+        node = data
+        for k in path:
+            node = node[k]
+        for k, r in replacements.items():
+            if r is not None and k in node:
+                node[k] = r
+                replaced.add((*path, k))
+    return data
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_outputs(output: str) -> tuple[tuple[str, str], ...]:
+    """Split the output identifier of a callback into the id and property of each output."""
+    if output.startswith("..") and output.endswith(".."):
+        # multiple outputs in a list (the list could contain a single item)
+        output_items = output[2:-2].split("...")
+    else:
+        # single Output (not in a list)
+        output_items = [output]
+    return tuple(tuple(output_item.rsplit(".", 1)) for output_item in output_items)
+
+
+def _walk_tree_and_replace(data: dict, overrides: dict) -> dict:
+    """Apply overrides, in place, to the components of a decoded layout tree.
+
+    See :meth:`WrappedDash.walk_tree_and_replace`.
+    """
+    if not overrides:
+        return data
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            replacements = None
+            # look for id entry
+            thisID = node.get("id", None)
+            if isinstance(thisID, dict):
+                # handle case of thisID being a dict (pattern) => compare its string form
+                thisID = wid2str(thisID)
+            if thisID is not None:
+                replacements = overrides.get(thisID, None)
+            # walk all keys and replace if needed
+            for k, v in node.items():
+                r = replacements.get(k, None) if replacements else None
+                if r is not None:
+                    node[k] = r
+                elif isinstance(v, (dict, list)):
+                    stack.append(v)
+        elif isinstance(node, list):
+            stack.extend(node)
+    return data
+
 
 @dataclass(frozen=True)
 class CallbackContext:
+    # Explicit slots, as dataclass(slots=True) requires Python 3.10
+    __slots__ = (
+        "inputs_list",
+        "inputs",
+        "states_list",
+        "states",
+        "outputs_list",
+        "outputs",
+        "triggered",
+    )
+
     inputs_list: list
     inputs: dict
     states_list: list
@@ -68,7 +341,7 @@ class WrappedDash(Dash):
     ):
         self._uid = ndid
 
-        self._flask_app = Flask(self._uid)
+        self._flask_app: Flask | None = None
         self._notflask = PseudoFlask()
         self._base_pathname = base_pathname
 
@@ -81,6 +354,7 @@ class WrappedDash(Dash):
         self.scripts.config.serve_locally = serve_locally
 
         self._adjust_id = False
+        self._fix_id_cache: dict[str, str] = {}
         self._replacements = replacements or {}
         self._use_dash_layout = len(self._replacements) < 1
 
@@ -96,7 +370,7 @@ class WrappedDash(Dash):
 
     def augment_initial_layout(
         self, base_response, initial_arguments: dict | None = None
-    ) -> tuple[dict, str]:
+    ) -> tuple[bytes, str]:
         """Add application state to initial values, if needed.
 
         Parameters
@@ -108,25 +382,24 @@ class WrappedDash(Dash):
 
         Returns
         -------
-        tuple[dict, str]
-            The augmented initial layout and the mimetype of the response.
+        tuple[bytes, str]
+            The encoded augmented initial layout and the mimetype of the response.
         """
-        if self.use_dash_layout() and not initial_arguments and False:
-            return base_response.data, base_response.mimetype
-
-        initial_arguments = initial_arguments or {}
-
-        # Adjust the base layout response
-        baseDataInBytes = base_response.data
-        baseData = json.loads(baseDataInBytes.decode("utf-8"))
+        # Define overrides as self._replacements updated with initial_arguments,
+        # only copying the replacements when there is something to merge into them
+        if initial_arguments:
+            overrides = {**self._replacements, **initial_arguments}
+        else:
+            overrides = self._replacements
 
-        # Define overrides as self._replacements updated with initial_arguments
-        overrides = {**self._replacements, **initial_arguments}
+        # Without overrides the layout is served unchanged
+        if not overrides:
+            return base_response.data, base_response.mimetype
 
         # Walk tree. If at any point we have an element whose id
-        # matches, then replace any named values at this level
-        reworked_data = self.walk_tree_and_replace(baseData, overrides)
-        response_data = json.dumps(reworked_data, cls=DjangoPlotlyJSONEncoder)
+        # matches, then replace any named values at this level.
+        # The result only depends on the base layout and the overrides, so it is cached
+        response_data = _augmented_layout(base_response.data, _dumps_key(overrides))
         return response_data, base_response.mimetype
 
     def walk_tree_and_extract(self, data: dict | list, target: dict) -> None:
@@ -139,25 +412,40 @@ class WrappedDash(Dash):
         target : dict
             The target dictionary to populate.
         """
-        if isinstance(data, dict):
-            for key in ["children", "props"]:
-                self.walk_tree_and_extract(data.get(key, None), target)
-            ident = data.get("id", None)
+        # Collect the components depth first, then visit them in reverse so that children
+        # are extracted before their parents
+        components = []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                components.append(node)
+                for key in _NESTED_KEYS:
+                    stack.append(node.get(key, None))
+            elif isinstance(node, list):
+                stack.extend(node)
+
+        for component in reversed(components):
+            ident = component.get("id", None)
             if ident is not None:
                 ident = wid2str(ident)
-                idVals = target.get(ident, {})
-                for key, value in data.items():
-                    if key not in ["props", "options", "children", "id"]:
-                        idVals[key] = value
+                idVals = {
+                    key: value
+                    for key, value in component.items()
+                    if key not in _NON_VALUE_KEYS
+                }
                 if idVals:
-                    target[ident] = idVals
-        if isinstance(data, list):
-            for element in data:
-                self.walk_tree_and_extract(element, target)
+                    existing = target.get(ident)
+                    if existing:
+                        existing.update(idVals)
+                    else:
+                        target[ident] = idVals
 
     def walk_tree_and_replace(self, data: dict, overrides: dict) -> dict:
         """Walk the tree. Rely on JSON decoding to insert instances of ``dict`` and ``list``.
 
+        The tree is updated in place, so ``data`` should be freshly decoded.
+
         Parameters
         ----------
         data : dict
@@ -170,41 +458,20 @@ class WrappedDash(Dash):
         dict
             The updated data.
         """
-        if isinstance(data, dict):
-            response = {}
-            replacements = {}
-            # look for id entry
-            thisID = data.get("id", None)
-            if isinstance(thisID, dict):
-                # handle case of thisID being a dict (pattern) => linear search in overrides dict
-                thisID = wid2str(thisID)
-                for k, v in overrides.items():
-                    if thisID == k:
-                        replacements = v
-                        break
-            elif thisID is not None:
-                # handle standard case of string thisID => key lookup
-                replacements = overrides.get(thisID, {})
-            # walk all keys and replace if needed
-            for k, v in data.items():
-                r = replacements.get(k, None)
-                if r is None:
-                    r = self.walk_tree_and_replace(v, overrides)
-                response[k] = r
-            return response
-        if isinstance(data, list):
-            # process each entry in turn and return
-            return [self.walk_tree_and_replace(x, overrides) for x in data]
-        return data
+        return _walk_tree_and_replace(data, overrides)
 
     def flask_app(self) -> Flask:
         """Underlying flask application for stub implementation.
 
+        The application is only created when first needed.
+
         Returns
         -------
         Flask
             The underlying flask application.
         """
+        if self._flask_app is None:
+            self._flask_app = Flask(self._uid)
         return self._flask_app
 
     def base_url(self) -> str:
@@ -225,11 +492,11 @@ class WrappedDash(Dash):
         dict
             The application context.
         """
-        return self._flask_app.app_context(*args, **kwargs)
+        return self.flask_app().app_context(*args, **kwargs)
 
     def test_request_context(self, *args, **kwargs):
         """Returns a test request context from underlying flask application."""
-        return self._flask_app.test_request_context(*args, **kwargs)
+        return self.flask_app().test_request_context(*args, **kwargs)
 
     def locate_endpoint_function(self, name: str | None = None):
         """Locate endpoint function given name of view.
@@ -240,7 +507,7 @@ class WrappedDash(Dash):
             The name of the view, by default None.
         """
         ep = self._base_pathname if name is None else f"{self._base_pathname}_{name}"
-        return self._notflask.endpoints[ep]["view_func"]
+        return self._notflask.endpoints[ep].view_func
 
     # pylint: disable=no-member
     @Dash.layout.setter
@@ -259,12 +526,17 @@ class WrappedDash(Dash):
 
     def _fix_component_id(self, component):
         """Fix the name of a component and all of its children."""
-        component_id = getattr(component, "id", None)
-        if component_id is not None:
-            setattr(component, "id", self._fix_id(component_id))
-        with suppress(Exception):
-            for c in component.children:
-                self._fix_component_id(c)
+        stack = [component]
+        while stack:
+            c = stack.pop()
+            component_id = getattr(c, "id", None)
+            if component_id is not None:
+                setattr(c, "id", self._fix_id(component_id))
+            children = getattr(c, "children", None)
+            if isinstance(children, (list, tuple)):
+                stack.extend(children)
+            elif children is not None:
+                stack.append(children)
 
     def _fix_id(self, name: str) -> str:
         """Adjust an identifier to include the component name.
@@ -281,24 +553,40 @@ class WrappedDash(Dash):
         """
         if not self._adjust_id:
             return name
-        return f"{self._uid}_-_{name}"
+        if not isinstance(name, str):
+            return f"{self._uid}_-_{name}"
+        fixed = self._fix_id_cache.get(name)
+        if fixed is None:
+            fixed = self._fix_id_cache[name] = f"{self._uid}_-_{name}"
+        return fixed
 
     def _fix_callback_item(self, item):
         """Update component identifier."""
-        item.component_id = self._fix_id(item.component_id)
+        if self._adjust_id:
+            item.component_id = self._fix_id(item.component_id)
         return item
 
-    def callback(self, output, inputs, state, prevent_initial_call):
-        """Invoke callback, adjusting variable names as needed."""
+    def _fix_callback_items(self, output, inputs, state) -> tuple:
+        """Update the component identifiers of the outputs, inputs and state of a callback.
+
+        The arguments are returned unchanged when identifiers are not being adjusted.
+        """
+        if not self._adjust_id:
+            return output, inputs, state
         if isinstance(output, (list, tuple)):
             fixed_outputs = [self._fix_callback_item(x) for x in output]
         else:
             fixed_outputs = self._fix_callback_item(output)
-
-        return super().callback(
+        return (
             fixed_outputs,
             [self._fix_callback_item(x) for x in inputs],
             [self._fix_callback_item(x) for x in state],
+        )
+
+    def callback(self, output, inputs, state, prevent_initial_call):
+        """Invoke callback, adjusting variable names as needed."""
+        return super().callback(
+            *self._fix_callback_items(output, inputs, state),
             prevent_initial_call=prevent_initial_call,
         )
 
@@ -306,43 +594,58 @@ class WrappedDash(Dash):
         self, clientside_function, output, inputs, state, prevent_initial_call
     ):  # pylint: disable=dangerous-default-value
         """Invoke callback, adjusting variable names as needed."""
-        if isinstance(output, (list, tuple)):
-            fixed_outputs = [self._fix_callback_item(x) for x in output]
-        else:
-            fixed_outputs = self._fix_callback_item(output)
-
         return super().clientside_callback(
             clientside_function,
-            fixed_outputs,
-            [self._fix_callback_item(x) for x in inputs],
-            [self._fix_callback_item(x) for x in state],
+            *self._fix_callback_items(output, inputs, state),
             prevent_initial_call=prevent_initial_call,
         )
 
     # pylint: disable=too-many-locals
     def dispatch_with_args(self, body: dict[str, Any], argMap: dict[str, Any]):
         """Perform callback dispatching, with enhanced arguments and recording of response."""
-        from django_plotly_dash.django_dash import expanded_parameters
-
         inputs_list = body.get("inputs", [])
-        input_values = inputs_to_dict(inputs_list)
         states = body.get("state", [])
         output = body["output"]
         outputs_list = body.get("outputs") or split_callback_id(output)
         changed_props = body.get("changedPropIds", [])
+
+        da = argMap.get("dash_app", None)
+
+        # In a single pass over inputs then states: collect the positional arguments,
+        # build the values dictionaries of the callback context and record the current state
+        input_values = AttributeDict()
+        state_values = AttributeDict()
+        args = []
+        for values, items in ((input_values, inputs_list), (state_values, states)):
+            for c in items:
+                if isinstance(c, list):  # ALL, ALLSMALLER
+                    v = []
+                    for ci in c:
+                        vi = ci.get("value")
+                        v.append(vi)
+                        values[f"{wid2str(ci['id'])}.{ci['property']}"] = vi
+                        if da:
+                            da.update_current_state(ci["id"], ci["property"], vi)
+                else:
+                    v = c.get("value")
+                    values[f"{wid2str(c['id'])}.{c['property']}"] = v
+                    if da:
+                        da.update_current_state(c["id"], c["property"], v)
+
+                args.append(v)
+
         triggered_inputs = [
             {"prop_id": x, "value": input_values.get(x)} for x in changed_props
         ]
-        callback_context_info = {
-            "inputs_list": inputs_list,
-            "inputs": input_values,
-            "states_list": states,
-            "states": inputs_to_dict(states),
-            "outputs_list": outputs_list,
-            "outputs": outputs_list,
-            "triggered": triggered_inputs,
-        }
-        callback_context = CallbackContext(**callback_context_info)
+        callback_context = CallbackContext(
+            inputs_list=inputs_list,
+            inputs=input_values,
+            states_list=states,
+            states=state_values,
+            outputs_list=outputs_list,
+            outputs=outputs_list,
+            triggered=triggered_inputs,
+        )
 
         # Overload dash global variable
         dash.callback_context = callback_context
@@ -351,35 +654,9 @@ class WrappedDash(Dash):
         if len(argMap) > 0:
             argMap["callback_context"] = callback_context
 
-        single_case = not (output.startswith("..") and output.endswith(".."))
-        if single_case:
-            # single Output (not in a list)
-            outputs = [output]
-        else:
-            # multiple outputs in a list (the list could contain a single item)
-            outputs = output[2:-2].split("...")
-
-        da = argMap.get("dash_app", None)
-
         callback_info = self.callback_map[output]
 
-        args = []
-
-        for c in inputs_list + states:
-            if isinstance(c, list):  # ALL, ALLSMALLER
-                v = [ci.get("value") for ci in c]
-                if da:
-                    for ci, vi in zip(c, v):
-                        da.update_current_state(ci["id"], ci["property"], vi)
-            else:
-                v = c.get("value")
-                if da:
-                    da.update_current_state(c["id"], c["property"], v)
-
-            args.append(v)
-
         # Dash 1.11 introduces a set of outputs
-        outputs_list = body.get("outputs") or split_callback_id(output)
         argMap["outputs_list"] = outputs_list
 
         # Special: intercept case of insufficient arguments
@@ -392,35 +669,30 @@ class WrappedDash(Dash):
         callback = callback_info["callback"]
         # smart injection of parameters if .expanded is defined
         try:
-            parameters = expanded_parameters[callback.__qualname__]
-        except KeyError as e:
-            message = f"Callback {callback} not found in expanded_parameters:\n{expanded_parameters}"
-            raise KeyError(message) from e
-        if parameters is not None:
-            res = callback(
-                *args,
-                **{
-                    k: v
-                    for k, v in argMap.items()
-                    if k in {*parameters, "outputs_list"}
-                },
+            # set on the function by DjangoDash.callback, and copied onto the Dash wrapper
+            parameters = callback._dpd_inject_set
+        except AttributeError:
+            # the callable could not hold it, so work it out from its signature
+            from django_plotly_dash.django_dash import _keywords_to_inject
+
+            parameters = _keywords_to_inject(
+                inspect.unwrap(callback),
+                len(callback_info["inputs"]) + len(callback_info["state"]),
             )
+        if parameters is not None:
+            res = callback(*args, **{k: argMap[k] for k in parameters if k in argMap})
         else:
             res = callback(*args, **argMap)
 
         if da:
-            root_value = json.loads(res).get("response", {})
-            for output_item in outputs:
-                if isinstance(output_item, str):
-                    output_id, output_property = output_item.split(".")
-                    if da.have_current_state_entry(output_id, output_property):
-                        value = root_value.get(output_id, {}).get(output_property)
-                        da.update_current_state(output_id, output_property, value)
-                else:
-                    # todo: implement saving of state for pattern matching ouputs
-                    raise NotImplementedError(
-                        "Updating state for dict keys (pattern matching) is not yet implemented"
-                    )
+            # the response is only parsed once, and only if an output is part of the app state
+            root_value = None
+            for output_id, output_property in _split_outputs(output):
+                if da.have_current_state_entry(output_id, output_property):
+                    if root_value is None:
+                        root_value = _loads(res).get("response", {})
+                    value = root_value.get(output_id, {}).get(output_property)
+                    da.update_current_state(output_id, output_property, value)
         return res
 
     def slugified_id(self) -> str:
@@ -457,27 +729,18 @@ class WrappedDash(Dash):
         renderer = self._generate_renderer()
         title = getattr(self, "title", "Dash")
         if self._favicon:
-            import flask
-
             favicon = '<link rel="icon" type="image/x-icon" href="{}">'.format(
-                flask.url_for("assets.static", filename=self._favicon)
+                url_for("assets.static", filename=self._favicon)
             )
         else:
             favicon = ""
-            _app_entry = """
-<div id="react-entry-point">
-  <div class="_dash-loading">
-    Loading...
-  </div>
-</div>
-"""
         index = self.interpolate_index(
             metas=metas,
             title=title,
             css=css,
             config=config,
             scripts=scripts,
-            app_entry=_app_entry,
+            app_entry=_APP_ENTRY,
             favicon=favicon,
             renderer=renderer,
         )
@@ -487,9 +750,9 @@ class WrappedDash(Dash):
         if not self._return_embedded:
             resp = super().interpolate_index(**kwargs)
             return resp
-        self._return_embedded.add_css(kwargs["css"])
-        self._return_embedded.add_config(kwargs["config"])
-        self._return_embedded.add_scripts(kwargs["scripts"])
+        self._return_embedded.add_all(
+            kwargs["css"], kwargs["config"], kwargs["scripts"]
+        )
         return kwargs["app_entry"]
 
     def set_embedded(self, embedded_holder: EmbeddedHolder | None = None) -> None:
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import itertools
+import re
+import sys
 import warnings
+from contextlib import suppress
 from typing import Callable
 
 from dash import dependencies
-from django.urls import reverse
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.urls.converters import SlugConverter
 
 from django_plotly_dash.app_name import app_name, main_view_label
 from django_plotly_dash.app_registry import registry
@@ -17,13 +24,166 @@ from django_plotly_dash.utils import static_asset_path
 #: The keys used to store the parts of a callback.
 CALLBACK_PART_KEYS: tuple[str] = "output", "inputs", "state", "prevent_initial_call"
 
-#: The expanded parameters to inject when calling a function.
-expanded_parameters: dict[Callable, list[str] | None] = {}
+#: The expanded parameters to inject when calling a function, keyed by its qualified name.
+#: Deprecated: only filled for compatibility with code that reads it. Dispatch does not use
+#: it, and relies on the ``_dpd_inject_set`` stored with each callback instead.
+expanded_parameters: dict[str, list[str] | None] = {}
+
+#: Matches the identifiers accepted by the ``slug`` path converter of the app URLs.
+_SLUG_RE = re.compile(SlugConverter.regex)
+
+#: Placeholders, valid as slugs, substituted when reversing an app URL template.
+_IDENT_PLACEHOLDER = "dpd-ident-placeholder"
+_CACHE_ID_PLACEHOLDER = "dpd-cache-id-placeholder"
+
+#: The URL names of the main view, keyed on (specific instance, cache id given).
+_APP_PATHNAMES: dict[tuple[bool, bool], str] = {
+    (False, False): f"{app_name}:app-{main_view_label}",
+    (False, True): f"{app_name}:app-{main_view_label}--args",
+    (True, False): f"{app_name}:{main_view_label}",
+    (True, True): f"{app_name}:{main_view_label}--args",
+}
+
+#: Counter used to name apps constructed without a name.
+_unnamed_app_counter = itertools.count(1)
+
+
+def _expanded_arguments(
+    func: Callable, n_dash_parameters: int
+) -> tuple[str, ...] | None:
+    """Compute, once per function and number of Dash parameters, the expanded arguments to inject.
+
+    See :meth:`DjangoDash.get_expanded_arguments` for the meaning of the result. The results are
+    kept on the function itself, or on the function behind a bound method, so that they live
+    only as long as it does. Callables that cannot hold them have them computed on every call.
+    """
+    target = getattr(func, "__func__", func)
+    # a bound method does not see its self parameter, unlike its underlying function
+    key = n_dash_parameters, target is not func
+    memo = getattr(target, "_dpd_expanded_arguments", None)
+    if memo is None:
+        memo = {}
+        with suppress(AttributeError, TypeError):
+            target._dpd_expanded_arguments = memo
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+    expanded = memo[key] = _signature_expanded_arguments(func, n_dash_parameters)
+    return expanded
+
+
+def _signature_expanded_arguments(
+    func: Callable, n_dash_parameters: int
+) -> tuple[str, ...] | None:
+    "Work out the expanded arguments to inject from the signature of a function"
+    positional_or_keyword, keyword_only = [], []
+    has_var_keyword = has_var_positional = False
+    for parameter in inspect.signature(func).parameters.values():
+        kind = parameter.kind
+        if kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            positional_or_keyword.append(parameter.name)
+        elif kind is inspect.Parameter.KEYWORD_ONLY:
+            keyword_only.append(parameter.name)
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            has_var_keyword = True
+        elif kind is inspect.Parameter.VAR_POSITIONAL:
+            has_var_positional = True
+    if has_var_keyword:
+        # there is some **kwargs, inject all parameters
+        return None
+    if has_var_positional:
+        # there is a *args, assume all parameters afterwards (KEYWORD_ONLY) are to be injected
+        # some of these parameters may not be expanded arguments but that is ok
+        return tuple(keyword_only)
+    # there is no **kwargs, filter argMap to take only the keyword arguments
+    return tuple(positional_or_keyword[n_dash_parameters:] + keyword_only)
+
+
+def _keywords_to_inject(
+    func: Callable, n_dash_parameters: int
+) -> frozenset[str] | None:
+    "Return the keyword arguments dispatch passes to a callback, or None to pass them all"
+    expanded = _expanded_arguments(func, n_dash_parameters)
+    return None if expanded is None else frozenset(expanded) | {"outputs_list"}
+
+
+def _reverse_app_url(
+    app_pathname: str, kwargs: dict, urlconf: str | None = None
+) -> str:
+    "Reverse an app URL, always ending with a slash"
+    full_url = reverse(app_pathname, urlconf=urlconf, kwargs=kwargs)
+    if full_url[-1] != "/":
+        full_url = full_url + "/"
+    return full_url
+
+
+@functools.lru_cache(maxsize=32)
+def _app_url_template(
+    app_pathname: str,
+    with_cache_id: bool,
+    script_prefix: str,  # pylint: disable=unused-argument
+    urlconf: str | None,
+) -> str:
+    "Reverse an app URL once with placeholders, giving a template to format with str.format"
+    kwargs = {"ident": _IDENT_PLACEHOLDER}
+    if with_cache_id:
+        kwargs["cache_id"] = _CACHE_ID_PLACEHOLDER
+    full_url = _reverse_app_url(app_pathname, kwargs, urlconf)
+    # braces are percent-encoded by reverse(), so the only fields are the placeholders
+    return full_url.replace(_IDENT_PLACEHOLDER, "{ident}").replace(
+        _CACHE_ID_PLACEHOLDER, "{cache_id}"
+    )
+
+
+def _app_url(app_pathname: str, ident: str, cache_id: str | None) -> str:
+    "Return an app URL, from the template for the script prefix and urlconf of this request"
+    if _SLUG_RE.fullmatch(ident) and (not cache_id or _SLUG_RE.fullmatch(cache_id)):
+        # slugs need no quoting, so they can be placed directly into the reversed template
+        template = _app_url_template(
+            app_pathname, bool(cache_id), get_script_prefix(), get_urlconf()
+        )
+        return template.format(ident=ident, cache_id=cache_id)
+    # let reverse() report identifiers the URL patterns do not accept
+    kwargs = {"ident": ident}
+    if cache_id:
+        kwargs["cache_id"] = cache_id
+    return _reverse_app_url(app_pathname, kwargs)
+
+
+@receiver(setting_changed)
+def _reset_app_urls(setting, **kwargs):
+    "Drop the memoized app URL templates when the URL configuration is overridden"
+    if setting == "ROOT_URLCONF":
+        _app_url_template.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _bootstrap_css_url() -> str:
+    "Return the URL of the bootstrap stylesheet, from django-bootstrap4 or django-bootstrap5"
+    # pylint: disable=import-outside-toplevel
+    try:
+        from bootstrap4.bootstrap import css_url
+
+        return css_url()["href"]
+    except:
+        from django_bootstrap5.core import css_url
+
+        return css_url()["url"]
+
+
+@receiver(setting_changed)
+def _reset_bootstrap_css_url(setting, **kwargs):
+    "Drop the memoized bootstrap stylesheet URL when the bootstrap settings are overridden"
+    if setting in ("BOOTSTRAP4", "BOOTSTRAP5"):
+        _bootstrap_css_url.cache_clear()
 
 
 class Holder:
     """Helper class for holding configuration options."""
 
+    __slots__ = ("items",)
+
     def __init__(self):
         self.items = []
 
@@ -66,7 +226,7 @@ class DjangoDash:
             )
 
         if name is None:
-            self.uid = f"djdash_{len(registry.apps) + 1}"
+            self._uid = f"djdash_{next(_unnamed_app_counter)}"
         else:
             self._uid = name
         self.layout = None
@@ -76,7 +236,7 @@ class DjangoDash:
         self.css = Holder()
         self.scripts = Holder()
 
-        registry.apps[self._uid] = self
+        registry.register(self._uid, self)
 
         if serve_locally is None:
             self._serve_locally = serve_locally_setting()
@@ -86,14 +246,7 @@ class DjangoDash:
         self._suppress_callback_exceptions = suppress_callback_exceptions
 
         if add_bootstrap_links:
-            try:
-                from bootstrap4.bootstrap import css_url
-
-                bootstrap_source = css_url()["href"]
-            except:
-                from django_bootstrap5.core import css_url
-
-                bootstrap_source = css_url()["url"]
+            bootstrap_source = _bootstrap_css_url()
 
             if self._serve_locally:
                 # Ensure package is loaded; if not present then pip install dpd-static-support
@@ -119,8 +272,9 @@ class DjangoDash:
                 )
 
         # Remember some caller info for static files
-        caller_frame = inspect.stack()[1]
-        self.caller_module = inspect.getmodule(caller_frame[0])
+        # only the calling frame is needed, not the source context of the whole stack
+        caller_frame = sys._getframe(1)  # pylint: disable=protected-access
+        self.caller_module = inspect.getmodule(caller_frame)
         try:
             self.caller_module_location = inspect.getfile(self.caller_module)
         except TypeError:
@@ -165,21 +319,12 @@ class DjangoDash:
             The unique identifier and the full URL for this instance.
         """
         if not specific_identifier:
-            app_pathname = "%s:app-%s" % (app_name, main_view_label)
             ndid = self._uid
         else:
-            app_pathname = "%s:%s" % (app_name, main_view_label)
             ndid = specific_identifier
+        app_pathname = _APP_PATHNAMES[bool(specific_identifier), bool(cache_id)]
 
-        kwargs = {"ident": ndid}
-
-        if cache_id:
-            kwargs["cache_id"] = cache_id
-            app_pathname = app_pathname + "--args"
-
-        full_url = reverse(app_pathname, kwargs=kwargs)
-        if full_url[-1] != "/":
-            full_url = full_url + "/"
+        full_url = _app_url(app_pathname, ndid, cache_id)
         return ndid, full_url
 
     def do_form_dash_instance(
@@ -282,27 +427,8 @@ class DjangoDash:
             The expanded arguments to add when called.
         """
         n_dash_parameters = len(inputs or []) + len(state or [])
-
-        parameters_by_kind = {
-            kind: [p.name for p in parameters]
-            for kind, parameters in itertools.groupby(
-                inspect.signature(func).parameters.values(), lambda p: p.kind
-            )
-        }
-        keyword_only = parameters_by_kind.get(inspect.Parameter.KEYWORD_ONLY, [])
-        if inspect.Parameter.VAR_KEYWORD in parameters_by_kind:
-            # there is some **kwargs, inject all parameters
-            return
-        elif inspect.Parameter.VAR_POSITIONAL in parameters_by_kind:
-            # there is a *args, assume all parameters afterwards (KEYWORD_ONLY) are to be injected
-            # some of these parameters may not be expanded arguments but that is ok
-            return keyword_only
-        else:
-            # there is no **kwargs, filter argMap to take only the keyword arguments
-            non_dash_parameters = parameters_by_kind.get(
-                inspect.Parameter.POSITIONAL_OR_KEYWORD, []
-            )[n_dash_parameters:]
-            return non_dash_parameters + keyword_only
+        expanded = _expanded_arguments(func, n_dash_parameters)
+        return None if expanded is None else list(expanded)
 
     def callback(self, *args, **kwargs):
         """Form a callback function by wrapping, in the same way as the underlying Dash application would
@@ -314,8 +440,16 @@ class DjangoDash:
         If the function has a *args => expanded arguments matching parameters after the *args are injected.
         Otherwise, take all arguments beyond the one provided by Dash (based on the Inputs/States provided).
         """
-        callback_parts = dependencies.handle_callback_args(args, kwargs)
-        callback_set = dict(zip(CALLBACK_PART_KEYS, callback_parts))
+        output, inputs, state, prevent_initial_call = dependencies.handle_callback_args(
+            args, kwargs
+        )
+        # parsed once here, and reused as is by every instance formed from this app
+        callback_set = {
+            "output": output,
+            "inputs": inputs,
+            "state": state,
+            "prevent_initial_call": prevent_initial_call,
+        }
 
         def wrap_func(func: Callable):
             self._callback_sets.append((callback_set, func))
@@ -323,11 +457,20 @@ class DjangoDash:
             # to inject properly only the expanded arguments the function can accept
             # if .expanded is None => inject all
             # if .expanded is a list => inject only
-            expanded_parameters[func.__qualname__] = self.get_expanded_arguments(
-                func,
-                callback_set["inputs"],
-                callback_set["state"],
-            )
+            parameters = self.get_expanded_arguments(func, inputs, state)
+            # compatibility only, see expanded_parameters
+            qualname = getattr(func, "__qualname__", None)
+            if qualname is not None:
+                expanded_parameters[qualname] = parameters
+            # the set of keyword arguments to inject is kept on the function, so that dispatch
+            # does not rebuild it on every call; bound methods keep it on their underlying
+            # function, and callables that cannot hold it have it recomputed by dispatch
+            with suppress(AttributeError):
+                getattr(func, "__func__", func)._dpd_inject_set = (
+                    None
+                    if parameters is None
+                    else frozenset(parameters) | {"outputs_list"}
+                )
             return func
 
         return wrap_func
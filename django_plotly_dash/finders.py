@@ -25,7 +25,7 @@ from __future__ import annotations
 
 import importlib
 import os
-from collections import OrderedDict
+import sys
 
 from django.apps import apps
 from django.conf import settings
@@ -38,13 +38,40 @@ from django_plotly_dash.utils import full_asset_path
 
 IGNORED_PATTERNS: list[str] = ["*.py", "*.pyc"]
 
+#: The number of found component file paths remembered by :func:`_exists`.
+FOUND_PATHS_CACHE_SIZE: int = 4096
+
+_found_paths: set[str] = set()
+
+
+def _exists(path: str) -> bool:
+    """Check whether a path exists, remembering the paths that do.
+
+    Only paths that were found are remembered, so a file added later is still picked up; a
+    remembered file that is later removed fails when it is opened instead.
+    """
+    if path in _found_paths:
+        return True
+    if not os.path.exists(path):
+        return False
+    if len(_found_paths) >= FOUND_PATHS_CACHE_SIZE:
+        _found_paths.clear()
+    _found_paths.add(path)
+    return True
+
+
+def _get_module(name: str):
+    "Return a module, importing it only if it is not already loaded"
+    module = sys.modules.get(name)
+    return module if module is not None else importlib.import_module(name)
+
 
 class DashComponentFinder(BaseFinder):
     """Find static files in components."""
 
     def __init__(self):
         self.locations = []
-        self.storages = OrderedDict()
+        self.storages = {}
         self.components = {}
         components = getattr(settings, "PLOTLY_COMPONENTS", [])
         built_ins = [
@@ -65,11 +92,11 @@ class DashComponentFinder(BaseFinder):
             split_name = component_name.split("/")
             try:
                 module_name = ".".join(split_name)
-                module = importlib.import_module(module_name)
+                module = _get_module(module_name)
                 path_directory = os.path.dirname(module.__file__)
             except Exception:
                 module_name = ".".join(split_name[:-1])
-                module = importlib.import_module(module_name)
+                module = _get_module(module_name)
                 path_directory = os.path.join(
                     os.path.dirname(module.__file__), split_name[-1]
                 )
@@ -90,12 +117,11 @@ class DashComponentFinder(BaseFinder):
             self.components[path] = component_name
 
         for module_name, component_list in built_ins:
-            module = importlib.import_module(module_name)
+            module = _get_module(module_name)
+            base_dir = os.path.dirname(module.__file__)
 
             for specific_component in component_list:
-                path_directory = os.path.join(
-                    os.path.dirname(module.__file__), specific_component
-                )
+                path_directory = os.path.join(base_dir, specific_component)
 
                 root = path_directory
                 component_name = f"{module_name}/{specific_component}"
@@ -110,24 +136,31 @@ class DashComponentFinder(BaseFinder):
                     self.storages[component_name] = storage
                     self.components[path] = component_name
 
+        # url prefix of each component => (search order, dir on disc)
+        self._prefix_index: dict[str, tuple[int, str]] = {}
+        for order, storage in enumerate(self.storages.values()):
+            self._prefix_index.setdefault(storage.prefix, (order, storage.location))
+
         super().__init__()
 
     def find(self, path, all=False):
-        matches = []
-        for component_name in self.locations:
-            storage = self.storages[component_name]
-            location = storage.location  # dir on disc
-            component_path = f"dash/component/{component_name}"
+        # look up each leading run of path segments, rather than trying every component
+        candidates = []
+        end = path.find("/")
+        while end != -1:
+            entry = self._prefix_index.get(path[:end])
+            if entry is not None:
+                candidates.append((entry, end))
+            end = path.find("/", end + 1)
+        candidates.sort()
 
-            if (
-                len(path) > len(component_path)
-                and path[: len(component_path)] == component_path
-            ):
-                matched_path = os.path.join(location, path[len(component_path) + 1 :])
-                if os.path.exists(matched_path):
-                    if not all:
-                        return matched_path
-                    matches.append(matched_path)
+        matches = []
+        for (_, location), end in candidates:
+            matched_path = os.path.join(location, path[end + 1 :])
+            if _exists(matched_path):
+                if not all:
+                    return matched_path
+                matches.append(matched_path)
         return matches
 
     # pylint: disable=inconsistent-return-statements, no-self-use
@@ -152,7 +185,7 @@ class DashAppDirectoryFinder(BaseFinder):
         # get all registered apps
 
         self.locations = []
-        self.storages = OrderedDict()
+        self.storages = {}
         for app_config in apps.get_app_configs():
             path_directory = os.path.join(app_config.path, "assets")
 
@@ -185,13 +218,12 @@ class DashAssetFinder(BaseFinder):
     # pylint: disable=unused-import, unused-variable, no-name-in-module, import-error, abstract-method
 
     def __init__(self):
-        # Ensure urls are loaded
-        root_urls = settings.ROOT_URLCONF
-        importlib.import_module(root_urls)
+        # Ensure urls are loaded, and so the apps they declare registered
+        _get_module(settings.ROOT_URLCONF)
 
         # Get all registered django dash apps
         self.locations = []
-        self.storages = OrderedDict()
+        self.storages = {}
 
         for app_slug, obj in registry.apps.items():
             location = obj.caller_module_location
@@ -51,6 +51,12 @@ class EmbeddedHolder:
         if scripts:
             self.scripts += scripts
 
+    def add_all(self, css, config, scripts):
+        "Add css, config and js content at once"
+        self.add_css(css)
+        self.add_config(config)
+        self.add_scripts(scripts)
+
 
 class ContentCollector:
     """
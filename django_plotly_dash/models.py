@@ -26,6 +26,7 @@ import logging
 
 from django.contrib import admin
 from django.db import models
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils.text import slugify
 
@@ -65,7 +66,11 @@ class StatelessApp(models.Model):
         """Returns a DjangoDash instance of the Dash application."""
         dateless_dash_app = getattr(self, "_stateless_dash_app_instance", None)
         if not dateless_dash_app:
-            dateless_dash_app = registry.get(self.app_name)
+            dateless_dash_app = registry.try_get(self.app_name)
+            if dateless_dash_app is None:
+                raise Http404(
+                    f"Unable to find stateless DjangoApp called {self.app_name}!"
+                )
             setattr(self, "_stateless_dash_app_instance", dateless_dash_app)
         return dateless_dash_app
 
@@ -76,11 +81,16 @@ def find_stateless_by_name(name: str):
 
     First search the Django ORM, and if not found then look the app up in a local registry.
     If the app does not have an ORM entry then a StatelessApp model instance is created.
+    If the app cannot be found at all then ``Http404`` is raised.
     """
     try:
         app_instance = StatelessApp.objects.get(app_name=name)  # pylint: disable=no-member
     except StatelessApp.DoesNotExist:
-        dash_app = registry.get(name)
+        dash_app = registry.try_get(name)
+        if dash_app is None:
+            raise Http404(
+                f"Unable to find stateless DjangoApp called {name}!"
+            ) from None
         app_instance = StatelessApp.objects.create(app_name=name)
         return dash_app
     else:
@@ -223,7 +233,7 @@ class DashApp(models.Model):
         base_app_inst = self.stateless_app.as_dash_app().as_dash_instance()  # pylint: disable=no-member
         # Get base layout response, from a base object
         base_resp = base_app_inst.locate_endpoint_function("dash-layout")()
-        base_obj = json.loads(base_resp.data.decode("utf-8"))
+        base_obj = json.loads(base_resp.data)
         # Walk the base layout and find all values; insert into base state map
         obj = {}
         base_app_inst.walk_tree_and_extract(base_obj, obj)
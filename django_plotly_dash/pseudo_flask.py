@@ -1,6 +1,23 @@
+from __future__ import annotations
+
+from typing import Any, Callable, NamedTuple
+
 from flask import Flask
 
 
+def _identity(f):
+    "Return the decorated function unchanged"
+    return f
+
+
+class Endpoint(NamedTuple):
+    """The parts of a registered url rule that are used to dispatch to its view."""
+
+    view_func: Callable | None
+    methods: Any
+    rule: str | None
+
+
 class PseudoFlask(Flask):
     """Dummy implementation of a Flask instance, providing stub functionality."""
 
@@ -18,14 +35,15 @@ class PseudoFlask(Flask):
         pass
 
     def errorhandler(self, *args, **kwargs):  # pylint: disable=no-self-use
-        def eh_func(f):
-            return args[0]
-
-        return eh_func
+        return _identity
 
     def add_url_rule(self, *args, **kwargs):
         route = kwargs["endpoint"]
-        self.endpoints[route] = kwargs
+        self.endpoints[route] = Endpoint(
+            kwargs.get("view_func"),
+            kwargs.get("methods"),
+            args[0] if args else kwargs.get("rule"),
+        )
 
     def before_first_request(self, *args, **kwargs):
         pass
@@ -25,7 +25,9 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+
 import json
+from dataclasses import dataclass
 from unittest.mock import patch
 
 import pytest
@@ -175,14 +177,14 @@ def test_dash_stateful_app_client_contract(client):
 
     # initialise layout with app state
     layout, mimetype = dash_instance.augment_initial_layout(resp, {})
-    assert '"n_clicks": 100' in layout
+    assert b'"n_clicks":100' in layout
 
     # initialise layout with initial arguments
     layout, mimetype = dash_instance.augment_initial_layout(
         resp, {'{"_id":"inp-2","_type":"btn5"}': {"n_clicks": 200}}
     )
-    assert '"n_clicks": 100' not in layout
-    assert '"n_clicks": 200' in layout
+    assert b'"n_clicks":100' not in layout
+    assert b'"n_clicks":200' in layout
 
     ########### test contract between client and app by replaying interactions recorded in tests_dash_contract.json
     # get update component route
@@ -965,3 +967,213 @@ def test_callback_decorator():
         return
 
     assert DjangoDash.get_expanded_arguments(callback_kwargs, inputs, states) == None
+
+    @dataclass
+    class UnhashableCallback:
+        prefix: str
+
+        def __call__(self, one, two, three, four, extra_1):
+            return
+
+    callback_unhashable = UnhashableCallback("x")
+    for _ in range(2):
+        assert DjangoDash.get_expanded_arguments(
+            callback_unhashable, inputs, states
+        ) == ["extra_1"]
+
+
+def test_registry_apps_read_only():
+    "Test apps are registered through the registry and its mapping cannot be mutated"
+
+    ddash = DjangoDash(name="ReadOnlyRegistryApp")
+
+    assert registry.get("ReadOnlyRegistryApp") is ddash
+    with pytest.raises(TypeError):
+        registry.apps["ReadOnlyRegistryApp"] = None
+
+
+def test_registry_missing_app_cache():
+    "Test unknown app names are remembered until registered or forgotten"
+
+    lookups = []
+
+    def counting_lookup(name):
+        lookups.append(name)
+
+    with patch(
+        "django_plotly_dash.app_registry.stateless_app_lookup_hook",
+        return_value=counting_lookup,
+    ):
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                registry.get("NotYetRegisteredApp")
+        assert lookups == ["NotYetRegisteredApp"]
+
+        registry.forget_missing("NotYetRegisteredApp")
+        assert registry.try_get("NotYetRegisteredApp") is None
+        assert lookups == ["NotYetRegisteredApp", "NotYetRegisteredApp"]
+
+        ddash = DjangoDash(name="NotYetRegisteredApp")
+        assert registry.get("NotYetRegisteredApp") is ddash
+
+
+@pytest.mark.django_db
+def test_unknown_stateless_app_not_found(client):
+    "Test an unknown stateless app name is reported as not found"
+
+    from django.http import Http404
+
+    from django_plotly_dash.models import StatelessApp
+
+    with patch(
+        "django_plotly_dash.app_registry.stateless_app_lookup_hook",
+        return_value=lambda _: None,
+    ):
+        assert registry.try_get("NoSuchStatelessApp") is None
+        with pytest.raises(Http404):
+            find_stateless_by_name("NoSuchStatelessApp")
+        with pytest.raises(Http404):
+            StatelessApp(app_name="NoSuchStatelessApp").as_dash_app()
+
+        url = reverse(
+            "the_django_plotly_dash:app-layout", kwargs={"ident": "NoSuchStatelessApp"}
+        )
+        response = client.get(url)
+        assert response.status_code == 404
+
+
+def test_augmented_initial_layout_cache():
+    "Test the augmented initial layout is reused for the same base layout and overrides"
+
+    from django_plotly_dash.dash_wrapper import _augmented_layout, clear_layout_caches
+
+    base_layout = json.dumps(
+        {"props": {"children": [{"props": {"id": "a", "value": 1}}]}}
+    ).encode("utf-8")
+    overrides = json.dumps({"a": {"value": 2}})
+
+    clear_layout_caches()
+    first = _augmented_layout(base_layout, overrides)
+    second = _augmented_layout(bytes(bytearray(base_layout)), overrides)
+
+    assert json.loads(first)["props"]["children"][0]["props"]["value"] == 2
+    assert second is first
+
+    clear_layout_caches()
+    assert _augmented_layout(base_layout, overrides) is not first
+
+
+def test_unnamed_apps_registered():
+    "Test apps constructed without a name are given distinct registered names"
+
+    first = DjangoDash()
+    second = DjangoDash()
+
+    assert first._uid != second._uid
+    assert registry.get(first._uid) is first
+    assert registry.get(second._uid) is second
+
+
+def test_base_pathname_cache():
+    "Test app URLs are built from a template reversed once per URL name"
+
+    from django_plotly_dash.django_dash import _app_url_template
+
+    app = DjangoDash("BasePathnameCacheApp")
+
+    _app_url_template.cache_clear()
+    first = app.get_base_pathname(None, None)
+    second = app.get_base_pathname("other-instance", None)
+
+    assert first[1] == reverse(
+        "the_django_plotly_dash:app-main", kwargs={"ident": "BasePathnameCacheApp"}
+    )
+    assert second[1] == reverse(
+        "the_django_plotly_dash:main", kwargs={"ident": "other-instance"}
+    )
+    assert app.get_base_pathname(None, None) == first
+    assert _app_url_template.cache_info().hits == 1
+
+
+def test_initial_layout_without_overrides():
+    "Test the initial layout is served unchanged when there is nothing to override"
+
+    from dash import html
+
+    app = DjangoDash("NoOverridesApp")
+    app.layout = html.Div(id="a", children="text")
+
+    dash_instance = app.as_dash_instance()
+    resp = dash_instance.serve_layout()
+
+    layout, mimetype = dash_instance.augment_initial_layout(resp, None)
+    assert layout is resp.data
+    assert mimetype == resp.mimetype
+
+
+def test_replace_by_path_matches_walk():
+    "Test overrides applied through the layout id index match a full walk of the layout"
+
+    from django_plotly_dash.dash_wrapper import (
+        _layout_id_paths,
+        _replace_by_path,
+        _walk_tree_and_replace,
+    )
+
+    inner = {"props": {"id": "inner", "value": 1}}
+    layout = {
+        "props": {
+            "children": [
+                {"props": {"id": "outer", "value": 1, "children": [inner]}},
+                {"props": {"id": {"index": 1, "type": "btn"}, "n_clicks": 0}},
+            ]
+        }
+    }
+    base_layout = json.dumps(layout).encode("utf-8")
+    overrides = {
+        "outer": {"children": [{"props": {"id": "inner", "value": 3}}]},
+        "inner": {"value": 2},
+        '{"index":1,"type":"btn"}': {"n_clicks": 5},
+    }
+
+    expected = _walk_tree_and_replace(json.loads(base_layout), overrides)
+    result = _replace_by_path(
+        json.loads(base_layout), _layout_id_paths(base_layout), overrides
+    )
+    assert result == expected
+    assert result["props"]["children"][0]["props"]["children"][0]["props"]["value"] == 3
+
+
+def test_bound_method_callback():
+    "Test bound methods and unhashable, attribute-less callables are expanded as callbacks"
+
+    from dash import dcc, html
+
+    class Handler:
+        def update(self, value, extra_1):
+            return f"{value}-{extra_1}"
+
+    class SlottedHandler:
+        __slots__ = ()
+        __hash__ = None
+
+        def __call__(self, value, extra_1):
+            return f"{value}+{extra_1}"
+
+    app = DjangoDash("BoundMethodCallbackApp")
+    app.layout = html.Div([dcc.Input(id="in"), html.Div(id="out"), html.Div(id="out2")])
+    app.callback(Output("out", "children"), Input("in", "value"))(Handler().update)
+    app.callback(Output("out2", "children"), Input("in", "value"))(SlottedHandler())
+
+    dash_instance = app.as_dash_instance()
+    for output, expected in (("out", "x-y"), ("out2", "x+y")):
+        res = dash_instance.dispatch_with_args(
+            {
+                "output": f"{output}.children",
+                "outputs": {"id": output, "property": "children"},
+                "inputs": [{"id": "in", "property": "value", "value": "x"}],
+                "changedPropIds": ["in.value"],
+            },
+            {"extra_1": "y", "extra_2": "z"},
+        )
+        assert json.loads(res)["response"][output]["children"] == expected
@@ -21,11 +21,14 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import functools
 import json
 import uuid
 
 from django.conf import settings
 from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.module_loading import import_string
 
 
@@ -140,6 +143,7 @@ def static_path(relative_path):
     return "%s%s" % (static_url, relative_path)
 
 
+@functools.lru_cache(maxsize=1)
 def stateless_app_lookup_hook():
     "Return a function that performs lookup for aa stateless app, given its name, or returns None"
 
@@ -152,6 +156,13 @@ def stateless_app_lookup_hook():
     return lambda _: None
 
 
+@receiver(setting_changed)
+def _reset_stateless_app_lookup_hook(setting, **kwargs):
+    "Drop the memoized lookup hook when the PLOTLY_DASH setting is overridden"
+    if setting == "PLOTLY_DASH":
+        stateless_app_lookup_hook.cache_clear()
+
+
 def wid2str(wid):
     """Convert a Python ID (``str`` or ``dict``) into its Dash representation.
 
@@ -161,5 +172,21 @@ def wid2str(wid):
     """
     if isinstance(wid, str):
         return wid
-    data = ",".join(f"{json.dumps(k)}:{json.dumps(v)}" for k, v in sorted(wid.items()))
-    return f"{{{data}}}"
+    items = tuple(sorted(wid.items()))
+    try:
+        # Value types are part of the key as True == 1 and 1 == 1.0, but they encode differently
+        return _wid_items2str(items, tuple(type(v) for _, v in items))
+    except TypeError:
+        # Unhashable values cannot be cached
+        return _dict_wid2str(wid)
+
+
+@functools.lru_cache(maxsize=4096)
+def _wid_items2str(items, types):  # pylint: disable=unused-argument
+    "Memoized conversion of the sorted items of a dict ID into its Dash representation"
+    return _dict_wid2str(dict(items))
+
+
+def _dict_wid2str(wid):
+    "Convert a dict ID into its Dash representation"
+    return json.dumps(wid, sort_keys=True, separators=(",", ":"))
@@ -83,7 +83,7 @@ def _update(request, ident, stateless=False, **kwargs):
     dash_app, app = DashApp.locate_item(ident, stateless)
 
     try:
-        request_body = json.loads(request.body.decode("utf-8"))
+        request_body = json.loads(request.body)
     except (JSONDecodeError, UnicodeDecodeError):
         return HttpResponse(status=200)
 
@@ -101,7 +101,7 @@ def _update(request, ident, stateless=False, **kwargs):
     dash_app.handle_current_state()
 
     # Special for ws-driven edge case
-    if str(resp) == "EDGECASEEXIT":
+    if resp == "EDGECASEEXIT":
         return HttpResponse("")
 
     # Change in returned value type